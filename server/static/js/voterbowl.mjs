@@ -267,28 +267,123 @@ const remainingTime = (endAt) => {
 };
 
 /**
- * @description A base class for countdown timers.
+ * Set an element's text, touching the DOM only if the text has changed.
+ *
+ * @param {HTMLElement} element The element to update.
+ * @param {string} text The new text.
+ * @returns {void}
  */
-class BaseCountdown extends HTMLElement {
+const setText = (element, text) => {
+  if (element.textContent !== text) {
+    element.textContent = text;
+  }
+};
+
+/**
+ * @description A single timer shared by every countdown on the page.
+ *
+ * Rather than running one interval per countdown, we run a single timer
+ * that ticks all subscribed countdowns and then sleeps until the wall
+ * clock crosses the next second boundary. The timer is stopped while the
+ * page is hidden, so background tabs do no work.
+ */
+class CountdownTicker {
+  /** @type {Set<BaseCountdown>} */
+  #countdowns = new Set();
   /** @type {number|null} */
-  #interval = null;
+  #timeout = null;
+  /** @type {number} */
+  #lastSecond = -1;
 
-  connectedCallback() {
-    if (!this.#interval) {
-      this.#interval = setInterval(() => this.tick(), 1000);
+  constructor() {
+    document.addEventListener("visibilitychange", this.handleVisibilityChange);
+  }
+
+  /**
+   * Start ticking the given countdown.
+   *
+   * @param {BaseCountdown} countdown
+   */
+  add(countdown) {
+    this.#countdowns.add(countdown);
+    countdown.tick();
+    this.#start();
+  }
+
+  /**
+   * Stop ticking the given countdown.
+   *
+   * @param {BaseCountdown} countdown
+   */
+  remove(countdown) {
+    this.#countdowns.delete(countdown);
+    if (this.#countdowns.size === 0) {
+      this.#stop();
+    }
+  }
+
+  #start() {
+    if (this.#timeout === null && !document.hidden) {
+      this.#timeout = setTimeout(this.tick, 1000 - (Date.now() % 1000));
+    }
+  }
+
+  #stop() {
+    if (this.#timeout !== null) {
+      clearTimeout(this.#timeout);
+      this.#timeout = null;
+    }
+  }
+
+  tick = () => {
+    this.#timeout = null;
+    // Timers can fire a little early; only tick once per wall-clock second.
+    const second = Math.floor(Date.now() / 1000);
+    if (second !== this.#lastSecond) {
+      this.#lastSecond = second;
+      for (const countdown of this.#countdowns) {
+        countdown.tick();
+      }
+    }
+    if (this.#countdowns.size > 0) {
+      this.#start();
+    }
+  };
+
+  handleVisibilityChange = () => {
+    if (document.hidden) {
+      this.#stop();
+    } else if (this.#countdowns.size > 0 && this.#timeout === null) {
+      this.#lastSecond = -1;
       this.tick();
     }
+  };
+}
+
+const ticker = new CountdownTicker();
+
+/**
+ * @description A base class for countdown timers.
+ */
+class BaseCountdown extends HTMLElement {
+  /** @type {Date|null} */
+  #endAt = null;
+
+  connectedCallback() {
+    this.#endAt = this.parseEndAt();
+    ticker.add(this);
   }
 
   disconnectedCallback() {
-    if (this.#interval) {
-      clearInterval(this.#interval);
-      this.#interval = null;
-    }
+    ticker.remove(this);
   }
 
-  /** @returns {Date} The end time of the countdown. */
-  get endAt() {
+  /**
+   * Parse the end time of the countdown from our data attribute.
+   *
+   * @returns {Date} The end time of the countdown.
+   */
+  parseEndAt() {
     const endAt = this.dataset.endAt;
     if (!endAt) {
       throw new Error("Missing endAt attribute");
@@ -296,6 +391,14 @@ class BaseCountdown extends HTMLElement {
     return new Date(endAt);
   }
 
+  /** @returns {Date} The end time of the countdown. */
+  get endAt() {
+    if (!this.#endAt) {
+      this.#endAt = this.parseEndAt();
+    }
+    return this.#endAt;
+  }
+
   tick() {
     const remaining = remainingTime(this.endAt);
     if (remaining === "ended") {
@@ -381,12 +484,12 @@ class BigCountdown extends BaseCountdown {
    * @returns {void}
    */
   update(remaining) {
-    this.#h0.innerText = remaining.h0.toString();
-    this.#h1.innerText = remaining.h1.toString();
-    this.#m0.innerText = remaining.m0.toString();
-    this.#m1.innerText = remaining.m1.toString();
-    this.#s0.innerText = remaining.s0.toString();
-    this.#s1.innerText = remaining.s1.toString();
+    setText(this.#h0, remaining.h0.toString());
+    setText(this.#h1, remaining.h1.toString());
+    setText(this.#m0, remaining.m0.toString());
+    setText(this.#m1, remaining.m1.toString());
+    setText(this.#s0, remaining.s0.toString());
+    setText(this.#s1, remaining.s1.toString());
   }
 
   /**
@@ -395,12 +498,12 @@ class BigCountdown extends BaseCountdown {
    * @returns {void}
    */
   ended() {
-    this.#h0.innerText = "0";
-    this.#h1.innerText = "0";
-    this.#m0.innerText = "0";
-    this.#m1.innerText = "0";
-    this.#s0.innerText = "0";
-    this.#s1.innerText = "0";
+    setText(this.#h0, "0");
+    setText(this.#h1, "0");
+    setText(this.#m0, "0");
+    setText(this.#m1, "0");
+    setText(this.#s0, "0");
+    setText(this.#s1, "0");
   }
 }
 
@@ -433,7 +536,10 @@ class SmallCountdown extends BaseCountdown {
    * @returns {void}
    */
   update(remaining) {
-    this.#countdown.innerText = `Ends in ${remaining.h0}${remaining.h1}:${remaining.m0}${remaining.m1}:${remaining.s0}${remaining.s1}`;
+    setText(
+      this.#countdown,
+      `Ends in ${remaining.h0}${remaining.h1}:${remaining.m0}${remaining.m1}:${remaining.s0}${remaining.s1}`
+    );
   }
 
   /**
@@ -442,7 +548,7 @@ class SmallCountdown extends BaseCountdown {
    * @returns {void}
    */
   ended() {
-    this.#countdown.innerText = "Just ended!";
+    setText(this.#countdown, "Just ended!");
   }
 }
 
@@ -2,12 +2,12 @@
 
 import pathlib
 import typing as t
-from dataclasses import dataclass, field, replace
+from functools import cache, lru_cache
 
 import htpy as h
 import markdown
 from htpy import _iter_children as _h_iter_children
-from markupsafe import Markup
+from markupsafe import Markup, escape
 
 
 def _load_file(file_name: str | pathlib.Path) -> str:
@@ -21,37 +21,85 @@ def _load_sibling_file(base_file_name: str | pathlib.Path, file_name: str) -> st
     return _load_file(pathlib.Path(base_file_name).resolve().parent / file_name)
 
 
+@cache
 def svg(base_file_name: str | pathlib.Path, file_name: str) -> Markup:
-    """Load an SVG file in the same directory as the base file."""
+    """
+    Load an SVG file in the same directory as the base file.
+
+    The file is read once and cached for the lifetime of the process.
+    """
     return Markup(_load_sibling_file(base_file_name, file_name))
 
 
+@cache
 def markdown_html(base_file_name: str | pathlib.Path, file_name: str) -> Markup:
-    """Load a markdown file in the same directory as the base file."""
+    """
+    Load a markdown file in the same directory as the base file.
+
+    The rendered HTML is cached for the lifetime of the process.
+    """
     text = _load_sibling_file(base_file_name, file_name)
     return Markup(markdown.markdown(text))
 
 
+@cache
+def _css_var_name(name: str) -> str:
+    """Convert a python keyword argument name to a CSS variable name."""
+    return f"--{name.replace('_', '-')}"
+
+
+@lru_cache(maxsize=256)
 def css_vars(**vars: str) -> str:
-    """Generate CSS variables to inject into an inline style attribute."""
-    return " ".join(f"--{k.replace('_', '-')}: {v};" for k, v in vars.items())
+    """
+    Generate CSS variables to inject into an inline style attribute.
+
+    Results are memoized: a given school's palette is identical across all of
+    its pages and contest cards, so we only build each style string once.
+    """
+    return " ".join([f"{_css_var_name(k)}: {v};" for k, v in vars.items()])
+
+
+class _BoundChildren[C, R: (h.Element, h.Node)]:
+    """A `with_children` component with its arguments bound."""
+
+    __slots__ = ("_args", "_f", "_kwargs")
+
+    def __init__(
+        self,
+        f: t.Callable[..., R],
+        args: tuple[t.Any, ...],
+        kwargs: dict[str, t.Any],
+    ) -> None:
+        """Bind the given arguments to the wrapped function."""
+        self._f = f
+        self._args = args
+        self._kwargs = kwargs
+
+    def __getitem__(self, children: C) -> R:
+        """Render the component with the given children."""
+        return self._f(children, *self._args, **self._kwargs)
+
+    def __str__(self) -> str:
+        """Return the name of the function being wrapped."""
+        return f"with_children[{self._f.__name__}]"
 
 
-@dataclass(frozen=True)
 class with_children[C, R: (h.Element, h.Node), **P]:
     """Wrap a function to make it look more like an htpy.Element."""
 
-    _f: t.Callable[t.Concatenate[C, P], R]
-    _args: tuple[t.Any, ...] = field(default_factory=tuple)
-    _kwargs: t.Mapping[str, t.Any] = field(default_factory=dict)
+    __slots__ = ("_f",)
+
+    def __init__(self, f: t.Callable[t.Concatenate[C, P], R]) -> None:
+        """Wrap the given component function."""
+        self._f = f
 
     def __getitem__(self, children: C) -> R:
         """Render the component with the given children."""
-        return self._f(children, *self._args, **self._kwargs)  # type: ignore
+        return self._f(children)  # type: ignore
 
-    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> t.Self:
-        """Return a new instance of the class with the given arguments."""
-        return replace(self, _args=args, _kwargs=kwargs)
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> _BoundChildren[C, R]:
+        """Return the component with the given arguments bound."""
+        return _BoundChildren(self._f, args, kwargs)
 
     def __str__(self) -> str:
         """Return the name of the function being wrapped."""
@@ -83,7 +131,14 @@ class Fragment:
 
     def __str__(self) -> Markup:
         """Return the fragment as a string."""
-        return Markup("".join(str(x) for x in self))
+        children = self._children
+        if children is None:
+            return Markup()
+        if isinstance(children, str):
+            return escape(children)
+        if isinstance(children, h.BaseElement):
+            return Markup(str(children))
+        return Markup("".join([str(x) for x in _h_iter_children(children)]))
 
     def __iter__(self):
         """Iterate over the children of the fragment."""
@@ -92,3 +147,13 @@ class Fragment:
 
 
 fragment = Fragment(None)
+
+
+def freeze(node: h.Node) -> Markup:
+    """
+    Render a node to a Markup string.
+
+    Use this for subtrees that never change: htpy emits Markup as-is, so a
+    frozen subtree is never walked or escaped again.
+    """
+    return Markup(str(fragment[node]))
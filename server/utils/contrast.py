@@ -1,4 +1,5 @@
 import typing as t
+from functools import lru_cache
 
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
@@ -21,8 +22,14 @@ def is_valid_hex_color(hex_color: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=256)
 def get_text_color(bg_hex_color: str) -> t.Literal["black", "white"]:
-    """Return an ideal text color for the given background hex color."""
+    """
+    Return an ideal text color for the given background hex color.
+
+    Results are memoized: a handful of school colors are asked about on
+    every page that shows a logo.
+    """
     if not is_valid_hex_color(bg_hex_color):
         raise ValueError("Invalid hex color.")
     hex = bg_hex_color.lstrip("#")
@@ -5,6 +5,7 @@ import typing as t
 
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
+from django.core.mail.backends.base import BaseEmailBackend
 from django.template.loader import render_to_string
 
 logger = logging.getLogger(__name__)
@@ -70,6 +71,7 @@ def send_template_email(
     template_base: str,
     context: dict | None = None,
     from_email: str | None = None,
+    connection: BaseEmailBackend | None = None,
 ) -> bool:
     """
     Send a templatized email.
@@ -92,10 +94,14 @@ def send_template_email(
     For instance, if we have `subject`/`body` templates in
     `server/assistant/templates/email/registration`, then `template_base` is
     `email/registration`.
+
+    Pass an open `connection` to reuse it when sending many emails in a row;
+    otherwise, a new connection is opened for this email alone.
     """
     to_array = [to] if isinstance(to, str) else to
 
     message = create_message(to_array, template_base, context, from_email)
+    message.connection = connection
     try:
         message.send()
         return True
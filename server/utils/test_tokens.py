@@ -0,0 +1,46 @@
+import unittest
+
+from . import tokens as tk
+
+
+class RandbelowManyTestCase(unittest.TestCase):
+    """Test the randbelow_many function."""
+
+    def test_count(self):
+        """Test that the requested number of values is returned."""
+        result = tk.randbelow_many(6, 100)
+        self.assertEqual(len(result), 100)
+
+    def test_range(self):
+        """Test that all values are in [0, n)."""
+        result = tk.randbelow_many(3, 1000)
+        self.assertTrue(all(0 <= value < 3 for value in result))
+
+    def test_one(self):
+        """Test that n=1 always returns zero."""
+        result = tk.randbelow_many(1, 10)
+        self.assertEqual(result, [0] * 10)
+
+    def test_empty(self):
+        """Test that a count of zero returns no values."""
+        result = tk.randbelow_many(6, 0)
+        self.assertEqual(result, [])
+
+    def test_invalid(self):
+        """Test that n must be positive."""
+        with self.assertRaises(ValueError):
+            tk.randbelow_many(0, 1)
+
+
+class MakeTokenTestCase(unittest.TestCase):
+    """Test the make_token function."""
+
+    def test_length(self):
+        """Test that the token has the requested length."""
+        result = tk.make_token(12)
+        self.assertEqual(len(result), 12)
+
+    def test_alphabet(self):
+        """Test that the token only uses characters from the alphabet."""
+        result = tk.make_token(100, alphabet="ab")
+        self.assertTrue(set(result) <= {"a", "b"})
@@ -1,9 +1,31 @@
 import secrets
 import string
+import struct
 
 DEFAULT_ALPHABET = string.ascii_letters + string.digits
 
+_WORD = 2**32
+
+
+def randbelow_many(n: int, count: int) -> list[int]:
+    """
+    Return `count` random ints in [0, n), like repeated `secrets.randbelow(n)`.
+
+    Randomness is read from the OS in one block rather than once per value.
+    Draws that would bias the result towards small values are rejected and
+    re-drawn, so every value in [0, n) is equally likely.
+    """
+    if not 0 < n <= _WORD:
+        raise ValueError(f"n must be in (0, 2**32], not {n}")
+    limit = _WORD - (_WORD % n)
+    values: list[int] = []
+    while len(values) < count:
+        need = count - len(values)
+        words = struct.unpack(f"<{need}I", secrets.token_bytes(4 * need))
+        values.extend([word % n for word in words if word < limit])
+    return values
+
 
 def make_token(length: int, alphabet: str = DEFAULT_ALPHABET) -> str:
     """Generate a random token."""
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    return "".join([alphabet[i] for i in randbelow_many(len(alphabet), length)])
@@ -273,6 +273,10 @@ class InlineContestEntryAdmin(admin.TabularInline):
     )
     ordering = ("-amount_won", "creation_request_id")
 
+    def get_queryset(self, request):
+        """Fetch each entry's student along with the entry itself."""
+        return super().get_queryset(request).select_related("student")
+
     def created_at_pacific(self, obj: ContestEntry) -> str:
         """Return the contest entry's creation time in the Pacific timezone."""
         return obj.created_at.astimezone(PACIFIC).strftime("%B %d, %Y @ %I:%M %p")
@@ -400,6 +404,7 @@ class ContestEntryAdmin(admin.ModelAdmin):
         "roll",
     )
     search_fields = ("id", "created_at", "student__email")
+    list_select_related = ("student__school", "contest__school")
     list_filter = (
         ContestWinnerListFilter,
         ContestWinningsIssuedListFilter,
@@ -459,6 +464,11 @@ class EmailValidationLinkAdmin(admin.ModelAdmin):
         "is_consumed",
     )
     search_fields = ("email", "token")
+    list_select_related = (
+        "student__school",
+        "contest_entry__student",
+        "contest_entry__contest",
+    )
 
     @admin.display(description="Student")
     def show_student(self, obj: EmailValidationLink) -> str:
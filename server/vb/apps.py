@@ -7,3 +7,15 @@ class VoterBowlConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "server.vb"
     verbose_name = "Voter Bowl"
+
+    def ready(self):
+        """Connect signal receivers once the app registry is ready."""
+        from django.db.models.signals import post_delete, post_save
+
+        from .components.school_page import clear_school_page_cache
+        from .models import Contest, Logo, School
+
+        # Cached school pages embed school, logo, and contest details.
+        for model in (School, Logo, Contest):
+            post_save.connect(clear_school_page_cache, sender=model)
+            post_delete.connect(clear_school_page_cache, sender=model)
@@ -148,7 +148,7 @@ def _finish_check_description(
                 "Thanks! Please register to vote if you haven't yet.",
                 h.br,
                 h.br,
-                f"You're entered into the ${contest.amount:,} drawing. We'll email you if you win."
+                f"You're entered into the ${contest.amount_str} drawing. We'll email you if you win."
                 if contest.is_monetary
                 else "You're entered into the drawing. We'll email you if you win.",
                 h.br,
@@ -1,6 +1,5 @@
 import datetime
-from dataclasses import dataclass
-from math import floor
+import typing as t
 
 import htpy as h
 
@@ -8,13 +7,14 @@ from server.utils.components import css_vars
 
 from ..models import Contest
 
+big_countdown = h.big_countdown
+
 # -----------------------------------------------------------------------------
 # Generic Countdown Utils
 # -----------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
-class RemainingTime:
+class RemainingTime(t.NamedTuple):
     """Render the remaining time until the given end time."""
 
     h0: int
@@ -41,25 +41,25 @@ class RemainingTime:
         return self.h0 == self.h1 == self.m0 == self.m1 == self.s0 == self.s1 == 0
 
 
+_ZERO = RemainingTime(0, 0, 0, 0, 0, 0)
+_ONE_SECOND = datetime.timedelta(seconds=1)
+_DIGITS = [divmod(n, 10) for n in range(100)]
+
+
 def remaining_time(
     end_at: datetime.datetime, when: datetime.datetime | None = None
 ) -> RemainingTime:
     """Render the remaining time until the given end time."""
     now = when or datetime.datetime.now(datetime.UTC)
-    delta = end_at - now
-    if delta.total_seconds() <= 0:
-        return RemainingTime(0, 0, 0, 0, 0, 0)
-    hours, remainder = divmod(delta.total_seconds(), 3600)
+    total = (end_at - now) // _ONE_SECOND
+    if total <= 0:
+        return _ZERO
+    hours, remainder = divmod(total, 3600)
     minutes, seconds = divmod(remainder, 60)
-    hours, minutes, seconds = map(floor, (hours, minutes, seconds))
-    return RemainingTime(
-        h0=hours // 10,
-        h1=hours % 10,
-        m0=minutes // 10,
-        m1=minutes % 10,
-        s0=seconds // 10,
-        s1=seconds % 10,
-    )
+    h0, h1 = _DIGITS[hours] if hours < 100 else divmod(hours, 10)
+    m0, m1 = _DIGITS[minutes]
+    s0, s1 = _DIGITS[seconds]
+    return RemainingTime(h0, h1, m0, m1, s0, s1)
 
 
 # -----------------------------------------------------------------------------
@@ -74,7 +74,7 @@ def _describe_contest(contest: Contest) -> h.Node:
     if contest.is_giveaway:
         if contest.is_monetary:
             return h.p[
-                f"${contest.amount:,} {contest.prize_long}",
+                f"${contest.amount_str} {contest.prize_long}",
                 h.br,
                 "giveaway ends in:",
             ]
@@ -86,7 +86,7 @@ def _describe_contest(contest: Contest) -> h.Node:
     if contest.is_dice_roll:
         if contest.is_monetary:
             return h.p[
-                f"${contest.amount:,} {contest.prize_long}",
+                f"${contest.amount_str} {contest.prize_long}",
                 h.br,
                 "contest ends in:",
             ]
@@ -98,7 +98,7 @@ def _describe_contest(contest: Contest) -> h.Node:
     if contest.is_single_winner:
         if contest.is_monetary:
             return h.p[
-                f"${contest.amount:,} {contest.prize_long}",
+                f"${contest.amount_str} {contest.prize_long}",
                 h.br,
                 "drawing ends in:",
             ]
@@ -110,12 +110,12 @@ def _describe_contest(contest: Contest) -> h.Node:
     raise ValueError(f"Unknown contest kind: {contest.kind}")
 
 
-def countdown(contest: Contest) -> h.Element:
+def countdown(contest: Contest, when: datetime.datetime | None = None) -> h.Element:
     """Render a countdown timer for the given contest."""
     logo = contest.school.logo
-    remaining = remaining_time(contest.end_at)
-    return h.big_countdown(
-        data_end_at=contest.end_at.isoformat(),
+    remaining = remaining_time(contest.end_at, when)
+    return big_countdown(
+        data_end_at=contest.end_at_iso,
         style=css_vars(
             number_color=logo.action_text_color,
             number_bg_color=logo.action_color,
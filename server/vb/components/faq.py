@@ -1,10 +1,19 @@
+from functools import cache
+
 import htpy as h
+from markupsafe import Markup
 
-from server.utils.components import markdown_html
+from server.utils.components import freeze, markdown_html
 
 from ..models import School
 
 
-def faq(school: School | None) -> h.Element:
+@cache
+def _faq() -> Markup:
+    """Render the frequently asked questions once."""
+    return freeze(h.div("#faq")[markdown_html(__file__, "faq.md")])
+
+
+def faq(school: School | None) -> Markup:
     """Render the frequently asked questions."""
-    return h.div("#faq")[markdown_html(__file__, "faq.md")]
+    return _faq()
@@ -1,3 +1,4 @@
+import datetime
 import typing as t
 
 import htpy as h
@@ -9,29 +10,31 @@ from .ongoing_contest import ongoing_contest
 from .upcoming_contest import upcoming_contest
 
 
-def _ongoing_contests(contests: list[Contest]) -> h.Node:
+def _ongoing_contests(
+    contests: t.Iterable[Contest], when: datetime.datetime | None = None
+) -> h.Element:
     """Render a list of ongoing contests."""
-    if contests:
-        return h.div(".ongoing")[(ongoing_contest(contest) for contest in contests)]
-    return None
+    return h.div(".ongoing")[(ongoing_contest(contest, when) for contest in contests)]
 
 
-def _upcoming_contests(contests: list[Contest]) -> h.Node:
-    if contests:
-        return [
-            h.p(".coming-soon")["Coming Soon"],
-            h.div(".upcoming")[(upcoming_contest(contest) for contest in contests)],
-        ]
-    return None
+def _upcoming_contests(contests: t.Iterable[Contest]) -> h.Node:
+    return [
+        h.p(".coming-soon")["Coming Soon"],
+        h.div(".upcoming")[(upcoming_contest(contest) for contest in contests)],
+    ]
 
 
 def home_page(
     ongoing_contests: t.Iterable[Contest],
     upcoming_contests: t.Iterable[Contest],
+    when: datetime.datetime | None = None,
 ) -> h.Element:
     """Render the home page for voterbowl.org."""
-    ongoing_contests = list(ongoing_contests)
-    upcoming_contests = list(upcoming_contests)
+    if not isinstance(ongoing_contests, t.Sequence):
+        ongoing_contests = list(ongoing_contests)
+    if not isinstance(upcoming_contests, t.Sequence):
+        upcoming_contests = list(upcoming_contests)
+    no_contests = not ongoing_contests and not upcoming_contests
 
     return base_page[
         h.div("#home-page")[
@@ -41,10 +44,14 @@ def home_page(
                     h.h2[
                         "College students win prizes by checking if they are registered to vote."
                     ],
-                    _ongoing_contests(ongoing_contests),
-                    _upcoming_contests(upcoming_contests),
+                    _ongoing_contests(ongoing_contests, when)
+                    if ongoing_contests
+                    else None,
+                    _upcoming_contests(upcoming_contests)
+                    if upcoming_contests
+                    else None,
                     h.p["There are no contests at this time. Check back later!"]
-                    if not ongoing_contests and not upcoming_contests
+                    if no_contests
                     else None,
                 ]
             ],
@@ -1,12 +1,22 @@
+from functools import cache
+
 import htpy as h
+from markupsafe import Markup
 
-from server.utils.components import markdown_html
+from server.utils.components import freeze, markdown_html
 
 from .base_page import base_page
 
 
-def rules_page() -> h.Element:
-    """Render the rules page."""
-    return base_page(title="Voter Bowl Rules", bg_color="white", show_faq=False)[
-        h.div("#rules-page.container")[markdown_html(__file__, "rules.md"),]
-    ]
+@cache
+def rules_page() -> Markup:
+    """
+    Render the rules page.
+
+    The rules never vary between requests, so we render them once.
+    """
+    return freeze(
+        base_page(title="Voter Bowl Rules", bg_color="white", show_faq=False)[
+            h.div("#rules-page.container")[markdown_html(__file__, "rules.md"),]
+        ]
+    )
@@ -1,13 +1,22 @@
+import datetime
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
 import htpy as h
+from markupsafe import Markup
 
-from server.utils.components import css_vars
+from server.utils.components import css_vars, freeze
 
-from ..models import Contest, School
+from ..models import Contest, ContestKind, School
 from .base_page import base_page
 from .button import button
 from .countdown import countdown
 from .logo import school_logo
 
+_WELCOME = h.h2["Welcome to the Voter Bowl"]
+
 
 def _no_current_prize_contest(school: School) -> h.Node:
     if school.mascot and school.percent_voted_2020:
@@ -15,61 +24,41 @@ def _no_current_prize_contest(school: School) -> h.Node:
             f"Join the {school.percent_voted_2020}% of the {school.mascot} who voted in the 2020 presidential election."
         ]
     return h.p[
-        school.short_name,
-        " ",
-        "students: check your voter registration now to avoid ",
-        "last-minute issues before the election.",
+        f"{school.short_name} students: check your voter registration now to avoid last-minute issues before the election."
     ]
 
 
+# How each kind of contest finishes the "check your voter registration"
+# sentence, keyed by (kind, is_monetary).
+_CONTEST_INFO: dict[tuple[str, bool], t.Callable[[Contest], str]] = {
+    (ContestKind.GIVEAWAY, True): lambda contest: (
+        f"to win a ${contest.amount_str} {contest.prize_long}."
+    ),
+    (ContestKind.GIVEAWAY, False): lambda contest: f"for a {contest.prize_long}.",
+    (ContestKind.DICE_ROLL, True): lambda contest: (
+        f"for a 1 in {contest.in_n} chance to win a ${contest.amount_str} {contest.prize_long}."
+    ),
+    (ContestKind.DICE_ROLL, False): lambda contest: (
+        f"for a 1 in {contest.in_n} chance at {contest.prize_long}."
+    ),
+    (ContestKind.SINGLE_WINNER, True): lambda contest: (
+        f"for a chance to win a ${contest.amount_str} {contest.prize_long}."
+    ),
+    (ContestKind.SINGLE_WINNER, False): lambda contest: (
+        f"for a chance to win {contest.prize_long}."
+    ),
+}
+
+
 def _current_contest_info(school: School, contest: Contest) -> h.Node:
-    if contest.is_no_prize:
+    if contest.kind == ContestKind.NO_PRIZE:
         return _no_current_prize_contest(school)
-    if contest.is_giveaway:
-        if contest.is_monetary:
-            return h.p[
-                school.short_name,
-                " ",
-                "students: check your voter registration ",
-                f"to win a ${contest.amount:,} {contest.prize_long}.",
-            ]
-        return h.p[
-            school.short_name,
-            " ",
-            "students: check your voter registration ",
-            f"for a {contest.prize_long}.",
-        ]
-    if contest.is_dice_roll:
-        if contest.is_monetary:
-            return h.p[
-                school.short_name,
-                " ",
-                "students: check your voter registration ",
-                f"for a 1 in {contest.in_n} chance ",
-                f"to win a ${contest.amount:,} {contest.prize_long}.",
-            ]
-        return h.p[
-            school.short_name,
-            " ",
-            "students: check your voter registration ",
-            f"for a 1 in {contest.in_n} chance",
-            f"at {contest.prize_long}.",
-        ]
-    if contest.is_single_winner:
-        if contest.is_monetary:
-            return h.p[
-                school.short_name,
-                " ",
-                "students: check your voter registration ",
-                f"for a chance to win a ${contest.amount:,} {contest.prize_long}.",
-            ]
-        return h.p[
-            school.short_name,
-            " ",
-            "students: check your voter registration ",
-            f"for a chance to win {contest.prize_long}.",
-        ]
-    raise ValueError(f"Unknown contest kind: {contest.kind}")
+    info = _CONTEST_INFO.get((contest.kind, contest.is_monetary))
+    if info is None:
+        raise ValueError(f"Unknown contest kind: {contest.kind}")
+    return h.p[
+        f"{school.short_name} students: check your voter registration {info(contest)}"
+    ]
 
 
 def _contest_info(school: School, current_contest: Contest | None) -> h.Node:
@@ -79,34 +68,87 @@ def _contest_info(school: School, current_contest: Contest | None) -> h.Node:
         return _no_current_prize_contest(school)
 
 
-def school_page(school: School, current_contest: Contest | None) -> h.Element:
-    """Render a school landing page."""
-    return base_page(
-        title=f"Voter Bowl x {school.name}", bg_color=school.logo.bg_color
-    )[
+def _school_page(
+    school: School, current_contest: Contest | None, countdown_slot: h.Node
+) -> h.Element:
+    """Render a school landing page with the given node in the countdown slot."""
+    logo = school.logo
+    bg_color = logo.bg_color
+    return base_page(title=f"Voter Bowl x {school.name}", bg_color=bg_color)[
         h.div(
             "#school-page",
-            style=css_vars(
-                bg_color=school.logo.bg_color,
-                color=school.logo.bg_text_color,
-            ),
+            style=css_vars(bg_color=bg_color, color=logo.bg_text_color),
         )[
             h.main[
                 h.div(".container")[
-                    countdown(current_contest)
-                    if current_contest and not current_contest.is_no_prize
-                    else None,
+                    countdown_slot,
                     school_logo(school),
-                    h.h2["Welcome to the Voter Bowl"],
+                    _WELCOME,
                     _contest_info(school, current_contest),
                     h.div(".button-holder")[
                         button(
                             href="./check/",
-                            bg_color=school.logo.action_color,
-                            color=school.logo.action_text_color,
+                            bg_color=logo.action_color,
+                            color=logo.action_text_color,
                         )["Check my voter status"]
                     ],
                 ]
             ],
         ]
     ]
+
+
+# Rendered school pages, keyed by (school pk, current contest pk).
+#
+# The countdown changes every second, so we cache the HTML on either side of
+# it and splice a freshly rendered countdown in on every request. Entries are
+# dropped whenever a school, logo, or contest is saved (see apps.py); the TTL
+# bounds staleness in *other* processes, which never see those signals, and
+# the size bound evicts the least recently used pages.
+_PAGE_CACHE_TTL = 60.0
+_PAGE_CACHE_SIZE = 512
+_COUNTDOWN_SLOT = Markup("<!-- countdown -->")
+_page_cache: OrderedDict[tuple[int, int | None], tuple[float, Markup, Markup]] = (
+    OrderedDict()
+)
+_page_cache_lock = threading.Lock()
+
+
+def clear_school_page_cache(**kwargs: t.Any) -> None:
+    """Forget all cached school pages. Usable as a signal receiver."""
+    with _page_cache_lock:
+        _page_cache.clear()
+
+
+def school_page(
+    school: School,
+    current_contest: Contest | None,
+    when: datetime.datetime | None = None,
+) -> Markup:
+    """Render a school landing page."""
+    show_countdown = current_contest is not None and not current_contest.is_no_prize
+    key = (school.pk, current_contest.pk if current_contest else None)
+    now = time.monotonic()
+    with _page_cache_lock:
+        cached = _page_cache.get(key)
+        if cached is not None and cached[0] > now:
+            _page_cache.move_to_end(key)
+        else:
+            cached = None
+    if cached is None:
+        page = freeze(
+            _school_page(
+                school, current_contest, _COUNTDOWN_SLOT if show_countdown else None
+            )
+        )
+        before, _, after = page.partition(_COUNTDOWN_SLOT)
+        cached = (now + _PAGE_CACHE_TTL, before, after)
+        with _page_cache_lock:
+            _page_cache[key] = cached
+            if len(_page_cache) > _PAGE_CACHE_SIZE:
+                _page_cache.popitem(last=False)
+    _, before, after = cached
+    if show_countdown:
+        assert current_contest is not None
+        return before + str(countdown(current_contest, when)) + after
+    return before + after
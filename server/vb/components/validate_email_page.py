@@ -1,49 +1,63 @@
+from functools import lru_cache
+
 import htpy as h
 from django.conf import settings
 from django.urls import reverse
+from markupsafe import Markup
 
-from server.utils.components import css_vars, svg
+from server.utils.components import css_vars, freeze, svg
 
 from ..models import ContestEntry, School
 from .base_page import base_page
 from .logo import school_logo
 
+_CLIPBOARD = freeze(
+    h.span(".clipboard", title="Copy to clipboard")[svg(__file__, "clipboard.svg")]
+)
 
-def _congrats(contest_entry: ContestEntry, claim_code: str) -> h.Node:
-    return [
-        h.p[f"Congrats! You won a ${contest_entry.amount_won} gift card!"],
-        h.h2[
-            h.span(".code")[claim_code],
-            h.span(".clipboard", title="Copy to clipboard")[
-                svg(__file__, "clipboard.svg")
-            ],
-            h.span(".copied hidden", title="Copied!")[
-                svg(__file__, "clipboard_check.svg")
-            ],
-        ],
+_CLIPBOARD_CHECK = freeze(
+    h.span(".copied hidden", title="Copied!")[svg(__file__, "clipboard_check.svg")]
+)
+
+_SORRY = freeze(
+    [
+        h.p["Sorry, ", h.b["there was an error"], ". Please try again later."],
         h.p[
-            "To use your gift card, copy the code above and paste it into ",
-            h.a(href="https://www.amazon.com/gc/redeem", target="_blank")["Amazon.com"],
+            "If you continue to have issues, please contact us at ",
+            h.a(href="mailto:info@voterbowl.org")["info@voterbowl.org"],
             ".",
         ],
-        h.p[
-            "Tell your friends so they can also win! Share this link: ",
-            h.a(
-                href=reverse(
-                    "vb:school", kwargs={"slug": contest_entry.contest.school.slug}
-                )
-            )[settings.BASE_HOST, "/", contest_entry.contest.school.slug],
-        ],
     ]
+)
+
+_REDEEM = freeze(
+    h.p[
+        "To use your gift card, copy the code above and paste it into ",
+        h.a(href="https://www.amazon.com/gc/redeem", target="_blank")["Amazon.com"],
+        ".",
+    ]
+)
+
 
+@lru_cache(maxsize=2048)
+def _share_link(slug: str) -> Markup:
+    """Render the link to a school's page; reverse() runs once per slug."""
+    href = reverse("vb:school", kwargs={"slug": slug})
+    return freeze(h.a(href=href)[settings.BASE_HOST, "/", slug])
 
-def _sorry() -> h.Node:
+
+def _congrats(contest_entry: ContestEntry, claim_code: str) -> h.Node:
     return [
-        h.p["Sorry, ", h.b["there was an error"], ". Please try again later."],
+        h.p[f"Congrats! You won a ${contest_entry.amount_won} gift card!"],
+        h.h2[
+            h.span(".code")[claim_code],
+            _CLIPBOARD,
+            _CLIPBOARD_CHECK,
+        ],
+        _REDEEM,
         h.p[
-            "If you continue to have issues, please contact us at ",
-            h.a(href="mailto:info@voterbowl.org")["info@voterbowl.org"],
-            ".",
+            "Tell your friends so they can also win! Share this link: ",
+            _share_link(contest_entry.contest.school.slug),
         ],
     ]
 
@@ -70,7 +84,7 @@ def validate_email_page(
                         school_logo(school),
                         _congrats(contest_entry, claim_code)
                         if contest_entry and claim_code
-                        else _sorry(),
+                        else _SORRY,
                     ],
                 ]
             ],
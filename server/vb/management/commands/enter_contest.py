@@ -1,9 +1,12 @@
-import typing as t
-
+from django.core.mail import get_connection
+from django.core.mail.backends.base import BaseEmailBackend
 from django.core.management.base import BaseCommand
+from django.db.models import Q, QuerySet
+
+from server.vb.models import Contest, Student
+from server.vb.ops import bulk_enter_contest, send_validation_link_email
 
-from server.vb.models import Contest, School, Student
-from server.vb.ops import enter_contest, send_validation_link_email
+BATCH_SIZE = 1000
 
 
 class Command(BaseCommand):
@@ -21,27 +24,52 @@ class Command(BaseCommand):
 
     def handle(self, contest_id, emails: list[str], **options):
         """Handle the command."""
-        contest = Contest.objects.get(pk=contest_id)
+        contest = Contest.objects.select_related("school").get(pk=contest_id)
         school = contest.school
-        for email in emails:
-            self._process_students(contest, school, email)
+        # Match every address and @domain pattern in a single query; a
+        # student matched by several of them is still only entered once.
+        query = Q()
+        for email in dict.fromkeys(emails):
+            if email[0] == "@":
+                query |= Q(email__endswith=email[1:])
+            else:
+                query |= Q(email=email)
+        # Winners are emailed as we go; share one mail connection among them.
+        with get_connection() as connection:
+            self._process_students(contest, school.students.filter(query), connection)
 
-    def _process_students(self, contest: Contest, school: School, email: str):
+    def _process_students(
+        self,
+        contest: Contest,
+        students: QuerySet[Student],
+        connection: BaseEmailBackend,
+    ):
         """Enter one or more students into a contest, if not already entered."""
-        if email[0] == "@":
-            students = t.cast(
-                t.Iterable[Student], school.students.filter(email__endswith=email[1:])
-            )
-        else:
-            students = t.cast(t.Iterable[Student], school.students.filter(email=email))
-
-        when = contest.start_at
-
-        for student in students:
+        # Stream matching students rather than loading a whole domain's worth
+        # at once, entering them one batch at a time.
+        batch: list[Student] = []
+        for student in students.iterator(chunk_size=BATCH_SIZE):
             if student.email.startswith("frontseat"):
                 self.stdout.write(f"SKIPFRN {student.email}")
                 continue
-            contest_entry, entered = enter_contest(student, contest, when=when)
+            batch.append(student)
+            if len(batch) >= BATCH_SIZE:
+                self._enter_students(contest, batch, connection)
+                batch = []
+        if batch:
+            self._enter_students(contest, batch, connection)
+
+    def _enter_students(
+        self,
+        contest: Contest,
+        students: list[Student],
+        connection: BaseEmailBackend,
+    ):
+        """Enter a batch of students into a contest, reporting the results."""
+        when = contest.start_at
+        results = bulk_enter_contest(students, contest, when=when)
+
+        for student, contest_entry, entered in results:
             winner = "!WINNER!" if contest_entry.is_winner else ""
             if entered:
                 self.stdout.write(
@@ -49,7 +77,7 @@ class Command(BaseCommand):
                 )
                 if contest_entry.is_winner:
                     link = send_validation_link_email(
-                        student, student.email, contest_entry
+                        student, student.email, contest_entry, connection
                     )
                     self.stdout.write(f"\t--> email sent: {link.relative_url}")
             else:
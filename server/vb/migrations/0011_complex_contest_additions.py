@@ -6,10 +6,7 @@ from django.db import migrations, models
 def data_migrate_kind(apps, schema_editor):
     Contest = apps.get_model('vb', 'Contest')
     # We had to pick a default kind for each contest; we fix historical data here.
-    for contest in Contest.objects.all():
-        if contest.kind == "giveaway" and contest.in_n > 1:
-            contest.kind = 'dice_roll'
-            contest.save()
+    Contest.objects.filter(kind='giveaway', in_n__gt=1).update(kind='dice_roll')
 
 
 class Migration(migrations.Migration):
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vb', '0013_add_subdomains_flag'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contest',
+            index=models.Index(fields=['school', 'start_at', 'end_at'], name='vb_contest_school__fbcbfb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contest',
+            index=models.Index(fields=['start_at'], name='vb_contest_start_a_285e0a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contest',
+            index=models.Index(fields=['end_at'], name='vb_contest_end_at_e832d3_idx'),
+        ),
+    ]
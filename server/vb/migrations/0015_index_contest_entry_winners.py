@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vb', '0014_index_contest_times'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contestentry',
+            index=models.Index(condition=models.Q(('roll', 0)), fields=['contest', '-created_at'], name='contest_entry_winners_idx'),
+        ),
+    ]
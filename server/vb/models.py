@@ -3,6 +3,7 @@ import datetime
 import hashlib
 import secrets
 import typing as t
+from functools import cached_property
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -11,7 +12,8 @@ from django.urls import reverse
 from django.utils.timezone import now as django_now
 
 from server.utils.contrast import HEX_COLOR_VALIDATOR, get_text_color
-from server.utils.email import Domains, normalize_email
+from server.utils.email import Domains, normalize_email, subdomain_of
+from server.utils.tokens import randbelow_many
 
 
 class ImageMimeType(models.TextChoices):
@@ -23,9 +25,19 @@ class ImageMimeType(models.TextChoices):
     SVG = "image/svg+xml"
 
 
+class SchoolManager(models.Manager):
+    """A custom manager for the school model."""
+
+    def with_logo(self):
+        """Return schools with their logo fetched in the same query."""
+        return self.select_related("logo")
+
+
 class School(models.Model):
     """A single school in the competition."""
 
+    objects = SchoolManager()
+
     name = models.CharField(max_length=255, blank=False)
     slug = models.SlugField(max_length=255, blank=False, unique=True)
 
@@ -60,14 +72,17 @@ class School(models.Model):
     contests: "ContestManager"
     students: "StudentManager"
 
+    @cached_property
+    def _domains(self) -> Domains:
+        return Domains(self.mail_domains[0], tuple(self.mail_domains[1:]))
+
     def normalize_email(self, address: str) -> str:
         """Normalize an email address for this school."""
-        domains = Domains(self.mail_domains[0], tuple(self.mail_domains[1:]))
         return normalize_email(
             address,
             tag=self.mail_tag if self.mail_tag else None,
             dots=self.mail_dots,
-            domains=domains,
+            domains=self._domains,
             allow_subdomains=self.allow_subdomains,
         )
 
@@ -78,12 +93,27 @@ class School(models.Model):
         These hashes are not suitable for sharing with third parties, since
         they are trivial to reverse-engineer.
         """
-        normalized = self.normalize_email(address)
+        return self._hash_normalized_email(self.normalize_email(address))
+
+    def _hash_normalized_email(self, normalized: str) -> str:
         return hashlib.sha256(normalized.encode("ascii")).hexdigest()
 
     def is_valid_email(self, address: str) -> bool:
-        """Validate an email address for this school."""
-        normalized = self.normalize_email(address)
+        """
+        Validate an email address for this school.
+
+        Equivalent to checking the domain of `normalize_email(address)`, but
+        only the domain is examined; the local part is never rebuilt.
+        """
+        _, _, domain = address.strip().lower().partition("@")
+        if self.allow_subdomains:
+            if any(subdomain_of(domain, d) for d in self.mail_domains):
+                return True
+        elif domain in self.mail_domains[1:]:
+            return True
+        return domain.encode("ascii", "ignore").decode("ascii") == self.mail_domains[0]
+
+    def _is_valid_normalized_email(self, normalized: str) -> bool:
         _, domain = normalized.split("@", maxsplit=1)
         return domain == self.mail_domains[0]
 
@@ -93,6 +123,18 @@ class School(models.Model):
             return
         raise ValidationError(f"Email address is not valid for {self.name}.")
 
+    def validate_and_hash_email(self, address: str) -> str:
+        """
+        Validate an email address for this school and return its hash.
+
+        Equivalent to `validate_email` followed by `hash_email`, but the
+        address is only normalized once.
+        """
+        normalized = self.normalize_email(address)
+        if not self._is_valid_normalized_email(normalized):
+            raise ValidationError(f"Email address is not valid for {self.name}.")
+        return self._hash_normalized_email(normalized)
+
     def __str__(self):
         """Return the school model's string representation."""
         return f"School: {self.name}"
@@ -125,22 +167,22 @@ class Logo(models.Model):
         max_length=7, validators=[HEX_COLOR_VALIDATOR], default="#ff0000"
     )
 
-    @property
+    @cached_property
     def b64(self) -> str:
         """Return the logo image as a base64 string."""
-        return base64.b64encode(self.data).decode("utf-8")
+        return base64.b64encode(self.data).decode("ascii")
 
-    @property
+    @cached_property
     def url(self) -> str:
         """Return the logo image as a data URL."""
         return f"data:{self.content_type};base64,{self.b64}"
 
-    @property
+    @cached_property
     def bg_text_color(self) -> t.Literal["black", "white"]:
         """Return the ideal text color for the background color."""
         return get_text_color(self.bg_color)
 
-    @property
+    @cached_property
     def action_text_color(self) -> t.Literal["black", "white"]:
         """Return the ideal text color for the action color."""
         return get_text_color(self.action_color)
@@ -195,6 +237,28 @@ class ContestKind(models.TextChoices):
     NO_PRIZE = "no_prize", "No prize"  # type: ignore
 
 
+# Administrative contest names, keyed by (kind, is_monetary).
+# 1 Tree Planted, $5 Amazon Gift Card Giveaway, ...
+_CONTEST_NAMES: dict[tuple[str, bool], t.Callable[["Contest"], str]] = {
+    (ContestKind.GIVEAWAY, True): lambda c: (
+        f"${c.amount_str} {c.prize_long.title()} Giveaway"
+    ),
+    (ContestKind.GIVEAWAY, False): lambda c: c.prize_long.title(),
+    (ContestKind.DICE_ROLL, True): lambda c: (
+        f"${c.amount_str} {c.prize_long.title()} Contest (1 in {c.in_n} wins)"
+    ),
+    (ContestKind.DICE_ROLL, False): lambda c: (
+        f"{c.prize_long.title()} (1 in {c.in_n} wins)"
+    ),
+    (ContestKind.SINGLE_WINNER, True): lambda c: (
+        f"${c.amount_str} {c.prize_long.title()} Drawing"
+    ),
+    (ContestKind.SINGLE_WINNER, False): lambda c: f"{c.prize_long.title()} Drawing",
+    (ContestKind.NO_PRIZE, True): lambda c: "No prize",
+    (ContestKind.NO_PRIZE, False): lambda c: "No prize",
+}
+
+
 class ContestWorkflow(models.TextChoices):
     """The various workflows for contests."""
 
@@ -337,6 +401,31 @@ class Contest(models.Model):
         amount_won = self.amount if roll == 0 else 0
         return roll, amount_won
 
+    def roll_dice_and_get_winnings(self, count: int) -> list[tuple[int, int]]:
+        """
+        Roll `count` fair dice at once; see `roll_die_and_get_winnings`.
+
+        Used when entering many students at once: randomness for all the
+        rolls is read in a single batch.
+        """
+        if not self.is_dice_roll:
+            return [self.roll_die_and_get_winnings()] * count
+        amount = self.amount
+        return [
+            (roll, amount if roll == 0 else 0)
+            for roll in randbelow_many(self.in_n, count)
+        ]
+
+    @cached_property
+    def amount_str(self) -> str:
+        """Return the prize amount formatted with thousands separators."""
+        return f"{self.amount:,}"
+
+    @cached_property
+    def end_at_iso(self) -> str:
+        """Return the contest's end time as an ISO 8601 string."""
+        return self.end_at.isoformat()
+
     def is_upcoming(self, when: datetime.datetime | None = None) -> bool:
         """Return whether the contest is upcoming."""
         when = when or django_now()
@@ -355,22 +444,23 @@ class Contest(models.Model):
     @property
     def name(self) -> str:
         """Render an administrative name for the template."""
-        if self.is_no_prize:
-            return "No prize"
-        elif self.is_giveaway:
-            # 1 Tree Planted, $5 Amazon Gift Card
-            if self.is_monetary:
-                return f"${self.amount:,} {self.prize_long.title()} Giveaway"
-            return f"{self.prize_long.title()}"
-        elif self.is_dice_roll:
-            if self.is_monetary:
-                return f"${self.amount:,} {self.prize_long.title()} Contest (1 in {self.in_n} wins)"  # noqa
-            return f"{self.prize_long.title()} (1 in {self.in_n} wins)"
-        elif self.is_single_winner:
-            if self.is_monetary:
-                return f"${self.amount:,} {self.prize_long.title()} Drawing"
-            return f"{self.prize_long.title()} Drawing"
-        raise ValueError("Unknown contest kind")
+        try:
+            name = _CONTEST_NAMES[(self.kind, self.is_monetary)]
+        except KeyError:
+            raise ValueError("Unknown contest kind") from None
+        return name(self)
+
+    class Meta:
+        """Define the contest model's meta options."""
+
+        indexes = [
+            # A school's current contest: school.contests.current()
+            models.Index(fields=["school", "start_at", "end_at"]),
+            # Ongoing and upcoming contests across all schools.
+            models.Index(fields=["start_at"]),
+            # Past contests, most recent first.
+            models.Index(fields=["end_at"]),
+        ]
 
     def __str__(self):
         """Return the contest model's string representation."""
@@ -454,20 +544,18 @@ class Student(models.Model):
         If the email is *not* the current primary email, make it so, moving
         the current primary email to the list of other emails.
         """
-        # Get a set of all emails for this student, including the new one.
-        all_emails = set(self.other_emails + [self.email] + [email])
-        assert email in all_emails  # how could this not be true?
-
-        # Remove the new one from the set and make it our new primary
-        all_emails.remove(email)
-        self.email = email
-
-        # Take all remaining emails and make them "other" emails
-        self.other_emails = list(all_emails)
+        update_fields = ["email_validated_at", "updated_at"]
+        if email != self.email:
+            # Demote the current primary email to the list of other emails.
+            others = [e for e in self.other_emails if e != email and e != self.email]
+            others.append(self.email)
+            self.email = email
+            self.other_emails = others
+            update_fields += ["email", "other_emails"]
 
         # Mark the student as having at least one validated email.
         self.email_validated_at = self.email_validated_at or when or django_now()
-        self.save()
+        self.save(update_fields=update_fields)
 
     @property
     def name(self) -> str:
@@ -495,10 +583,16 @@ class EmailValidationLinkManager(models.Manager):
         """Return all email validation links that are not consumed."""
         return self.filter(consumed_at__isnull=True)
 
+    def with_related(self):
+        """Return all email validation links with their student and contest."""
+        return self.select_related("student__school", "contest_entry__contest")
+
 
 class EmailValidationLink(models.Model):
     """A single email validation link for a student in a contest."""
 
+    objects = EmailValidationLinkManager()
+
     student = models.ForeignKey(
         Student, on_delete=models.CASCADE, related_name="email_validation_links"
     )
@@ -559,7 +653,7 @@ class EmailValidationLink(models.Model):
         """Consume the email validation link."""
         when = when or django_now()
         self.consumed_at = when
-        self.save()
+        self.save(update_fields=["consumed_at"])
 
         # Demeter says no, but my heart says yes.
         self.student.mark_validated(self.email, when)
@@ -661,6 +755,19 @@ class ContestEntry(models.Model):
             )
         ]
 
+        indexes = [
+            # Contest.most_recent_winner(), checked on every finished check.
+            models.Index(
+                fields=["contest", "-created_at"],
+                condition=models.Q(roll=0),
+                name="contest_entry_winners_idx",
+            ),
+        ]
+
     def __str__(self):
         """Return the gift card model's string representation."""
         return f"Contest entry for {self.student.name} in {self.contest.name} (${self.amount_won} won)"  # noqa
+
+    def __repr__(self):
+        """Return a debugging representation that doesn't touch related rows."""
+        return f"<ContestEntry id={self.pk} roll={self.roll} amount={self.amount_won}>"
@@ -1,6 +1,8 @@
 import datetime
 import logging
+import typing as t
 
+from django.core.mail.backends.base import BaseEmailBackend
 from django.db import transaction
 
 from server.utils.agcod import AGCODClient
@@ -86,6 +88,67 @@ def enter_contest(
         return _create_contest_entry(student, contest), True
 
 
+def bulk_enter_contest(
+    students: t.Sequence[Student],
+    contest: Contest,
+    when: datetime.datetime | None = None,
+) -> list[tuple[Student, ContestEntry, bool]]:
+    """
+    Return contest entries for many students at once.
+
+    This is `enter_contest` for batches: existing entries are fetched in one
+    query and all missing entries are created with a single bulk insert.
+    Returns a `(student, contest_entry, entered)` tuple for each student, in
+    the order given.
+
+    Raise a ContestEntryPreconditionError if any student is not eligible.
+    """
+    for student in students:
+        if student.school_id != contest.school_id:
+            raise ContestEntryPreconditionError(
+                f"Student {student.email} is not eligible for contest '{contest.name}'"
+            )
+
+    with transaction.atomic():
+        existing = {
+            entry.student_id: entry
+            for entry in ContestEntry.objects.filter(
+                contest=contest, student__in=students
+            )
+        }
+        new_students = [s for s in students if s.pk not in existing]
+        if new_students and not contest.is_ongoing(when):
+            raise ContestEntryPreconditionError(
+                f"Students cannot enter inactive '{contest.name}'"
+            )
+
+        rolls = contest.roll_dice_and_get_winnings(len(new_students))
+        new_entries = [
+            ContestEntry(
+                student=student,
+                contest=contest,
+                roll=roll,
+                amount_won=amount_won,
+            )
+            for student, (roll, amount_won) in zip(new_students, rolls, strict=True)
+        ]
+        # A concurrent entry for one of these students is a conflict, just as
+        # it is in `enter_contest`: let the IntegrityError surface.
+        ContestEntry.objects.bulk_create(new_entries, batch_size=1000)
+        created = {entry.student_id: entry for entry in new_entries}
+
+    # The email templates read contest_entry.contest and .student.school;
+    # share the instances we already have rather than fetching them again.
+    results = []
+    for student in students:
+        entered = student.pk not in existing
+        entry = created[student.pk] if entered else existing[student.pk]
+        entry.contest = contest
+        entry.student = student
+        results.append((student, entry, entered))
+    return results
+
+
 # -----------------------------------------------------------------------------
 # Gift Card Management
 # -----------------------------------------------------------------------------
@@ -196,7 +259,10 @@ def process_contest_workflow(
 
 
 def send_validation_link_email(
-    student: Student, email: str, contest_entry: ContestEntry
+    student: Student,
+    email: str,
+    contest_entry: ContestEntry,
+    connection: BaseEmailBackend | None = None,
 ) -> EmailValidationLink:
     """Send an email with a link to allow the student to claim their prize."""
     assert contest_entry.is_winner
@@ -217,6 +283,7 @@ def send_validation_link_email(
             "link": link,
             "button_text": button_text,
         },
+        connection=connection,
     )
     if not success:
         logger.error(f"Failed to send email validation link to {email}")
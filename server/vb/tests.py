@@ -1,8 +1,12 @@
+import datetime
 import unittest
 
 from django.core.exceptions import ValidationError
+from django.test import TestCase
+from django.utils.timezone import now as dj_now
 
-from .models import School
+from .models import Contest, ContestEntry, ContestKind, School, Student
+from .ops import ContestEntryPreconditionError, bulk_enter_contest
 
 
 class SchoolTestCase(unittest.TestCase):
@@ -36,6 +40,20 @@ class SchoolTestCase(unittest.TestCase):
         result = school.is_valid_email(email)
         self.assertTrue(result)
 
+    def test_is_valid_email_subdomain_true(self):
+        """Test a valid email address on a subdomain."""
+        school = School(mail_domains=["example.com"], allow_subdomains=True)
+        email = "test@mail.example.com"
+        result = school.is_valid_email(email)
+        self.assertTrue(result)
+
+    def test_is_valid_email_subdomain_false(self):
+        """Test a subdomain email address when subdomains are not allowed."""
+        school = School(mail_domains=["example.com"], allow_subdomains=False)
+        email = "test@mail.example.com"
+        result = school.is_valid_email(email)
+        self.assertFalse(result)
+
     def test_validate_email_valid(self):
         """Test a valid email address."""
         school = School(mail_domains=["example.com"])
@@ -63,6 +81,20 @@ class SchoolTestCase(unittest.TestCase):
         hashed = [school.hash_email(email) for email in emails]
         self.assertEqual(len(set(hashed)), 1)
 
+    def test_validate_and_hash_email_valid(self):
+        """Test validating and hashing a valid email address."""
+        school = School(mail_domains=["example.com"])
+        email = "te.st+tag@example.com"
+        result = school.validate_and_hash_email(email)
+        self.assertEqual(result, school.hash_email(email))
+
+    def test_validate_and_hash_email_invalid(self):
+        """Test validating and hashing an invalid email address."""
+        school = School(mail_domains=["example.com"])
+        email = "test@nope.com"
+        with self.assertRaises(ValidationError):
+            school.validate_and_hash_email(email)
+
     def test_no_tag(self):
         """Test an email address with no tag separation."""
         school = School(mail_domains=["example.com"], mail_tag="")
@@ -78,3 +110,84 @@ class SchoolTestCase(unittest.TestCase):
         expected = "test.test@example.com"
         result = school.normalize_email(email)
         self.assertEqual(result, expected)
+
+
+class BulkEnterContestTestCase(TestCase):
+    """Test entering many students into a contest at once."""
+
+    def setUp(self):
+        """Create a school with an ongoing giveaway and some students."""
+        self.school = School.objects.create(
+            name="Test School", short_name="Test", slug="test", mail_domains=["t.edu"]
+        )
+        when = dj_now()
+        self.contest = Contest.objects.create(
+            school=self.school,
+            start_at=when - datetime.timedelta(hours=1),
+            end_at=when + datetime.timedelta(hours=1),
+            kind=ContestKind.GIVEAWAY,
+            amount=5,
+        )
+        self.students = [self._student(self.school, f"s{i}") for i in range(3)]
+
+    def _student(self, school: School, name: str) -> Student:
+        return Student.objects.create(
+            school=school,
+            email=f"{name}@t.edu",
+            hash=name,
+            first_name=name,
+            last_name="Test",
+        )
+
+    def test_new_students(self):
+        """Test that new students are entered in the order given."""
+        results = bulk_enter_contest(self.students, self.contest)
+        self.assertEqual([r[0] for r in results], self.students)
+        for student, entry, entered in results:
+            self.assertTrue(entered)
+            self.assertIsNotNone(entry.pk)
+            self.assertEqual(entry.student, student)
+            self.assertEqual(entry.contest, self.contest)
+            self.assertEqual(entry.amount_won, 5)
+        self.assertEqual(ContestEntry.objects.filter(contest=self.contest).count(), 3)
+
+    def test_already_entered(self):
+        """Test that existing entries are returned rather than re-created."""
+        existing = ContestEntry.objects.create(
+            student=self.students[0], contest=self.contest, roll=0, amount_won=5
+        )
+        results = bulk_enter_contest(self.students, self.contest)
+        self.assertEqual(results[0][1].pk, existing.pk)
+        self.assertFalse(results[0][2])
+        self.assertTrue(all(entered for _, _, entered in results[1:]))
+        self.assertEqual(ContestEntry.objects.filter(contest=self.contest).count(), 3)
+
+    def test_wrong_school(self):
+        """Test that students from another school are rejected."""
+        other = School.objects.create(
+            name="Other School",
+            short_name="Other",
+            slug="other",
+            mail_domains=["o.edu"],
+        )
+        students = [*self.students, self._student(other, "o0")]
+        with self.assertRaises(ContestEntryPreconditionError):
+            bulk_enter_contest(students, self.contest)
+        self.assertFalse(ContestEntry.objects.exists())
+
+    def test_inactive_contest(self):
+        """Test that new students can't enter a contest that has ended."""
+        when = self.contest.end_at + datetime.timedelta(minutes=1)
+        with self.assertRaises(ContestEntryPreconditionError):
+            bulk_enter_contest(self.students, self.contest, when=when)
+        self.assertFalse(ContestEntry.objects.exists())
+
+    def test_inactive_contest_already_entered(self):
+        """Test that existing entries are still returned after a contest ends."""
+        for student in self.students:
+            ContestEntry.objects.create(
+                student=student, contest=self.contest, roll=0, amount_won=5
+            )
+        when = self.contest.end_at + datetime.timedelta(minutes=1)
+        results = bulk_enter_contest(self.students, self.contest, when=when)
+        self.assertFalse(any(entered for _, _, entered in results))
@@ -27,9 +27,18 @@ logger = logging.getLogger(__name__)
 @require_GET
 def home(request: HttpRequest) -> HttpResponse:
     """Render the voterbowl homepage."""
-    ongoing_contests = Contest.objects.ongoing().order_by("end_at")
-    upcoming_contests = Contest.objects.upcoming().order_by("start_at")
-    return HttpResponse(home_page(ongoing_contests, upcoming_contests))
+    when = dj_now()
+    ongoing_contests = (
+        Contest.objects.ongoing(when=when)
+        .select_related("school__logo")
+        .order_by("end_at")
+    )
+    upcoming_contests = (
+        Contest.objects.upcoming(when=when)
+        .select_related("school__logo")
+        .order_by("start_at")
+    )
+    return HttpResponse(home_page(ongoing_contests, upcoming_contests, when=when))
 
 
 @require_GET
@@ -51,11 +60,14 @@ def school(request: HttpRequest, slug: str) -> HttpResponse:
     Otherwise, show generic text encouraging the visitor to check their
     voter registration anyway.
     """
-    school = School.objects.filter(slug=slug).first()
+    # The page itself is usually served from cache and only needs the logo's
+    # colors; its image bytes are loaded on demand when the page is rebuilt.
+    school = School.objects.with_logo().defer("logo__data").filter(slug=slug).first()
     if school is None:
         return redirect("vb:home", permanent=False)
-    current_contest = school.contests.current()
-    return HttpResponse(school_page(school, current_contest))
+    when = dj_now()
+    current_contest = school.contests.current(when=when)
+    return HttpResponse(school_page(school, current_contest, when=when))
 
 
 @require_GET
@@ -65,7 +77,7 @@ def check(request: HttpRequest, slug: str) -> HttpResponse:
 
     This does something useful whether or not the school has a current contest.
     """
-    school = get_object_or_404(School, slug=slug)
+    school = get_object_or_404(School.objects.with_logo(), slug=slug)
     current_contest = school.contests.current()
     return HttpResponse(check_page(school, current_contest))
 
@@ -87,8 +99,7 @@ class FinishCheckForm(forms.Form):
     def clean_email(self):
         """Ensure the email address is not already in use."""
         email = self.cleaned_data["email"]
-        self._school.validate_email(email)
-        self.cleaned_data["hash"] = self._school.hash_email(email)
+        self.cleaned_data["hash"] = self._school.validate_and_hash_email(email)
         return email
 
     def has_only_email_error(self):
@@ -109,7 +120,7 @@ def finish_check(request: HttpRequest, slug: str) -> HttpResponse:
     """
     # Use a consistent time so that contest entry is not skewed
     when = dj_now()
-    school = get_object_or_404(School, slug=slug)
+    school = get_object_or_404(School.objects.with_logo(), slug=slug)
     current_contest = school.contests.current(when=when)
     form = FinishCheckForm(request.POST, school=school)
     if not form.is_valid():
@@ -170,8 +181,8 @@ def validate_email(request: HttpRequest, slug: str, token: str) -> HttpResponse:
     It's possible the user has clicked this validation link before. Behavior
     must be idempotent.
     """
-    link = get_object_or_404(EmailValidationLink, token=token)
-    school = get_object_or_404(School, slug=slug)
+    link = get_object_or_404(EmailValidationLink.objects.with_related(), token=token)
+    school = get_object_or_404(School.objects.with_logo(), slug=slug)
     if link.student.school != school:
         raise PermissionDenied("Invalid email validation link URL")
 